@@ -1,35 +1,38 @@
 import argparse
-import json
 import logging
+from functools import lru_cache
+from typing import Dict, List, Optional
 
+from resy_bot.constants import SEARCH_BATCH_MAX_WORKERS
 from resy_bot.logging import setup_logging
 from resy_bot.models import ResyConfig, TimedReservationRequest, Watchlist
 from resy_bot.manager import ResyManager
 from resy_bot.api_access import ResyApiAccess
-from resy_bot.notifications import notify_booking_result
+from resy_bot.search_cache import VenueSearchCache
+from resy_bot.notifications import configure_rate_limit, notify_booking_result
 from resy_bot.watchlist import run_watchlist
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def load_resy_config(resy_config_path: str) -> ResyConfig:
+    return ResyConfig.parse_file(resy_config_path)
+
+
 def wait_for_drop_time(resy_config_path: str, reservation_config_path: str) -> str:
     setup_logging()
     logger.info("waiting for drop time!")
 
-    with open(resy_config_path, "r") as f:
-        config_data = json.load(f)
-
-    with open(reservation_config_path, "r") as f:
-        reservation_data = json.load(f)
-
-    config = ResyConfig(**config_data)
+    config = load_resy_config(resy_config_path)
+    configure_rate_limit(config.notification_rate_per_second, config.notification_burst)
     manager = ResyManager.build(config)
 
-    timed_request = TimedReservationRequest(**reservation_data)
+    timed_request = TimedReservationRequest.parse_file(reservation_config_path)
 
     try:
         resy_token = manager.make_reservation_at_opening_time(timed_request)
-        logger.info(f"Booking successful! Resy token: {resy_token}")
+        logger.info("Booking successful! Resy token: %s", resy_token)
 
         notify_booking_result(
             success=True,
@@ -46,7 +49,7 @@ def wait_for_drop_time(resy_config_path: str, reservation_config_path: str) -> s
         return resy_token
 
     except Exception as e:
-        logger.error(f"Booking failed: {e}")
+        logger.error("Booking failed: %s", e)
 
         notify_booking_result(
             success=False,
@@ -61,34 +64,25 @@ def wait_for_drop_time(resy_config_path: str, reservation_config_path: str) -> s
 
         raise
 
+    finally:
+        manager.close()
+
 
 def run_watchlist_command(resy_config_path: str, watchlist_path: str) -> None:
     setup_logging()
     logger.info("Running watchlist mode")
 
-    with open(resy_config_path, "r") as f:
-        config_data = json.load(f)
-
-    with open(watchlist_path, "r") as f:
-        watchlist_data = json.load(f)
+    config = load_resy_config(resy_config_path)
+    watchlist = Watchlist.parse_file(watchlist_path)
 
-    config = ResyConfig(**config_data)
-    watchlist = Watchlist(**watchlist_data)
-
-    logger.info(f"Loaded watchlist with {len(watchlist.venues)} venue(s)")
+    logger.info("Loaded watchlist with %d venue(s)", len(watchlist.venues))
     run_watchlist(config, watchlist)
 
 
-def search_venue_command(resy_config_path: str, query: str) -> None:
-    setup_logging()
-
-    with open(resy_config_path, "r") as f:
-        config_data = json.load(f)
-
-    config = ResyConfig(**config_data)
-    api_access = ResyApiAccess.build(config)
-
-    results = api_access.search_venues(query=query)
+def _print_search_results(query: str, results: Optional[List[Dict]]) -> None:
+    if results is None:
+        print(f"Search failed for '{query}'")
+        return
 
     if not results:
         print(f"No venues found for '{query}'")
@@ -108,6 +102,30 @@ def search_venue_command(resy_config_path: str, query: str) -> None:
         print(f"{vid:<12} {name:<35} {cuisine:<20} {neighborhood:<20} {location}")
 
 
+def search_venue_command(
+    resy_config_path: str, query: Optional[str], batch_path: Optional[str] = None
+) -> None:
+    setup_logging()
+
+    config = load_resy_config(resy_config_path)
+    search_cache = VenueSearchCache(config.search_cache_path)
+
+    if batch_path is None:
+        assert query is not None
+        with ResyApiAccess.build(config, search_cache=search_cache) as api_access:
+            _print_search_results(query, api_access.search_venues(query=query))
+        return
+
+    with open(batch_path, "r") as f:
+        queries = [line.strip() for line in f if line.strip()]
+
+    with ResyApiAccess.build(
+        config, pool_maxsize=SEARCH_BATCH_MAX_WORKERS, search_cache=search_cache
+    ) as api_access:
+        for batch_query, results in api_access.search_venues_batch(queries):
+            _print_search_results(batch_query, results)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         prog="ResyBot",
@@ -133,7 +151,10 @@ if __name__ == "__main__":
         "search", help="Search for a venue by name"
     )
     search_parser.add_argument("resy_config_path", help="Path to credentials.json")
-    search_parser.add_argument("query", help="Restaurant name to search for")
+    search_parser.add_argument("query", nargs="?", help="Restaurant name to search for")
+    search_parser.add_argument(
+        "--batch", help="Path to a file of restaurant names, one per line"
+    )
 
     args = parser.parse_args()
 
@@ -142,6 +163,10 @@ if __name__ == "__main__":
     elif args.command == "watchlist":
         run_watchlist_command(args.resy_config_path, args.watchlist_path)
     elif args.command == "search":
-        search_venue_command(args.resy_config_path, args.query)
+        if args.query is None and args.batch is None:
+            search_parser.error("provide a query or --batch")
+        if args.query is not None and args.batch is not None:
+            search_parser.error("provide a query or --batch, not both")
+        search_venue_command(args.resy_config_path, args.query, args.batch)
     else:
         parser.print_help()
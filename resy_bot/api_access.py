@@ -1,10 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from requests import Session, HTTPError
-from typing import Dict, List
-
-from resy_bot.constants import RESY_BASE_URL, ResyEndpoints
+from requests import Session, HTTPError, RequestException
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from resy_bot.constants import (
+    RESY_BASE_URL,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    SEARCH_BATCH_MAX_WORKERS,
+    WARM_UP_TIMEOUT_SECONDS,
+    ResyEndpoints,
+)
 from resy_bot.errors import ResyServerError
 from resy_bot.logging import logging
+from resy_bot.search_cache import VenueSearchCache
 from resy_bot.models import (
     ResyConfig,
     AuthRequestBody,
@@ -21,9 +31,26 @@ from resy_bot.models import (
 logger = logging.getLogger(__name__)
 logger.setLevel("INFO")
 
+BOOK_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Origin": "https://widgets.resy.com",
+    "X-Origin": "https://widgets.resy.com",
+    "Referrer": "https://widgets.resy.com/",
+    "Cache-Control": "no-cache",
+}
 
-def build_session(config: ResyConfig) -> Session:
+
+def build_session(config: ResyConfig, pool_maxsize: int = HTTP_POOL_MAXSIZE) -> Session:
     session = Session()
+    # all threads share this session, so keep enough pooled connections
+    # around that none of them has to open a fresh TLS connection.
+    # retries are handled by ResyManager, never silently by urllib3
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
     headers = {
         "Authorization": config.get_authorization(),
         "X-Resy-Auth-Token": config.token,
@@ -42,14 +69,65 @@ def build_session(config: ResyConfig) -> Session:
 
 class ResyApiAccess:
     @classmethod
-    def build(cls, config: ResyConfig) -> "ResyApiAccess":
-        session = build_session(config)
-        return cls(session)
-
-    def __init__(self, session: Session):
+    def build(
+        cls,
+        config: ResyConfig,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        search_cache: Optional[VenueSearchCache] = None,
+    ) -> "ResyApiAccess":
+        session = build_session(config, pool_maxsize)
+        return cls(session, search_cache)
+
+    def __init__(
+        self, session: Session, search_cache: Optional[VenueSearchCache] = None
+    ):
         self.session = session
+        self.search_cache = search_cache
+
+    def __enter__(self) -> "ResyApiAccess":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        release the pooled connections; the session is otherwise kept open
+        for the lifetime of this object so every request reuses them
+        """
+        self.session.close()
+
+    def warm_up(self) -> None:
+        """
+        make a throwaway request so DNS, TCP and TLS are already set up
+        on a pooled connection by the time the reservation requests go out
+        """
+        try:
+            self.session.get(RESY_BASE_URL + "/", timeout=WARM_UP_TIMEOUT_SECONDS)
+        except RequestException as e:
+            logger.warning("Connection warm up failed: %s", e)
 
     def search_venues(self, query: str) -> List[Dict]:
+        if self.search_cache is None:
+            return self._search_venues(query)
+
+        cached = self.search_cache.get(query)
+        if cached is not None:
+            return cached
+
+        try:
+            results = self._search_venues(query)
+        except RequestException:
+            stale = self.search_cache.get(query, allow_stale=True)
+            if stale is None:
+                raise
+            logger.warning("Venue search failed, using cached results for %s", query)
+            return stale
+
+        self.search_cache.set(query, results)
+        return results
+
+    def _search_venues(self, query: str) -> List[Dict]:
         search_url = RESY_BASE_URL + ResyEndpoints.VENUE_SEARCH.value
 
         resp = self.session.post(
@@ -78,6 +156,31 @@ class ResyApiAccess:
             for hit in hits
         ]
 
+    def search_venues_batch(
+        self, queries: List[str]
+    ) -> Iterator[Tuple[str, Optional[List[Dict]]]]:
+        """
+        run venue searches concurrently over the shared session,
+        yielding (query, results) pairs in the order they complete.
+        a failed query is logged and yields None, so it doesn't take
+        the rest of the batch down with it
+        """
+        if not queries:
+            return
+
+        max_workers = min(SEARCH_BATCH_MAX_WORKERS, len(queries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.search_venues, q): q for q in queries}
+            for future in as_completed(futures):
+                query = futures[future]
+                results: Optional[List[Dict]]
+                try:
+                    results = future.result()
+                except RequestException as e:
+                    logger.warning("Venue search failed for %s: %s", query, e)
+                    results = None
+                yield query, results
+
     def auth(self, body: AuthRequestBody) -> AuthResponseBody:
         auth_url = RESY_BASE_URL + ResyEndpoints.PASSWORD_AUTH.value
 
@@ -96,12 +199,12 @@ class ResyApiAccess:
         find_url = RESY_BASE_URL + ResyEndpoints.FIND.value
 
         logger.info(
-            f"{datetime.now().isoformat()} Sending request to find booking slots"
+            "%s Sending request to find booking slots", datetime.now().isoformat()
         )
 
         resp = self.session.get(find_url, params=params.dict())
 
-        logger.info(f"{datetime.now().isoformat()} Received response for ")
+        logger.info("%s Received response for ", datetime.now().isoformat())
 
         if resp.status_code == 500:
             raise ResyServerError(
@@ -132,9 +235,9 @@ class ResyApiAccess:
     def _dump_book_request_body_to_dict(self, body: BookRequestBody) -> Dict:
         """
         requests lib doesn't urlencode nested dictionaries,
-        so dump struct_payment_method to json and slot that in the dict
+        so dump struct_payment_method to compact json and slot that in the dict
         """
-        payment_method = body.struct_payment_method.json().replace(" ", "")
+        payment_method = body.struct_payment_method.json(separators=(",", ":"))
         body_dict = body.dict()
         body_dict["struct_payment_method"] = payment_method
         return body_dict
@@ -144,24 +247,17 @@ class ResyApiAccess:
 
         body_dict = self._dump_book_request_body_to_dict(body)
 
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Origin": "https://widgets.resy.com",
-            "X-Origin": "https://widgets.resy.com",
-            "Referrer": "https://widgets.resy.com/",
-            "Cache-Control": "no-cache",
-        }
-
         resp = self.session.post(
             book_url,
             data=body_dict,
-            headers=headers,
+            headers=BOOK_HEADERS,
         )
 
         if not resp.ok:
             raise HTTPError(f"Failed to book slot: {resp.status_code}, {resp.text}")
 
-        logger.info(resp.json())
-        parsed_resp = BookResponseBody(**resp.json())
+        resp_json = resp.json()
+        logger.info("%s", resp_json)
+        parsed_resp = BookResponseBody(**resp_json)
 
         return parsed_resp.resy_token
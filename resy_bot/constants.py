@@ -1,11 +1,33 @@
 from enum import Enum
 
 
+NS_PER_SECOND = 1_000_000_000
+NS_PER_MILLISECOND = 1_000_000
+NS_PER_MICROSECOND = 1_000
+
 RESY_BASE_URL = "https://api.resy.com"
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+SEARCH_BATCH_MAX_WORKERS = 16
+SEARCH_CACHE_PATH = "~/.resy-bot/search_cache"
+SEARCH_CACHE_TTL_SECONDS = 3600
 N_RETRIES = 20
 SECONDS_TO_WAIT_BETWEEN_RETRIES = 0.3
 EARLY_START_SECONDS = 2
 SERVER_ERROR_RETRY_WAIT = 2.0
+BACKOFF_CAP_SECONDS = 5.0
+BACKOFF_MAX_EXPONENT = 5
+BACKOFF_JITTER = 0.5
+FIND_CACHE_TTL_SECONDS = 0.25
+FIND_PREFETCH_MAX_WORKERS = 8
+# connections one reservation run can hold at once: the calling thread, its
+# prefetch workers and a speculative find that may still be in flight
+CONNECTIONS_PER_RESERVATION = FIND_PREFETCH_MAX_WORKERS + 2
+FINE_WAIT_SECONDS = 0.05
+WAIT_LOG_INTERVAL_SECONDS = 10
+WARM_UP_LEAD_SECONDS = 5
+WARM_UP_TIMEOUT_SECONDS = 2.0
+SPECULATIVE_RESULT_TIMEOUT_SECONDS = 0.05
 
 
 class ResyEndpoints(Enum):
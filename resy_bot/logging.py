@@ -1,10 +1,17 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 
 
 def setup_logging() -> None:
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
     log_dir = "logs"
     os.makedirs(log_dir, exist_ok=True)
 
@@ -23,7 +30,14 @@ def setup_logging() -> None:
     stream_handler.setLevel(logging.DEBUG)
     stream_handler.setFormatter(formatter)
 
-    root_logger = logging.getLogger()
+    # callers only enqueue records; a listener thread does the actual
+    # file and stdout writes, keeping that I/O off the booking threads
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(stream_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
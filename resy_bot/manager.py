@@ -1,20 +1,39 @@
+import random
+import threading
 import time
+from time import sleep
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, date, timedelta
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
+
+from requests import RequestException
 
 from resy_bot.logging import logging
-from resy_bot.errors import NoSlotsError, ExhaustedRetriesError, ResyServerError
+from resy_bot.errors import NoSlotsError, ExhaustedRetriesError
 from resy_bot.constants import (
+    CONNECTIONS_PER_RESERVATION,
     N_RETRIES,
     SECONDS_TO_WAIT_BETWEEN_RETRIES,
     EARLY_START_SECONDS,
-    SERVER_ERROR_RETRY_WAIT,
+    FIND_CACHE_TTL_SECONDS,
+    FIND_PREFETCH_MAX_WORKERS,
+    FINE_WAIT_SECONDS,
+    WAIT_LOG_INTERVAL_SECONDS,
+    WARM_UP_LEAD_SECONDS,
+    WARM_UP_TIMEOUT_SECONDS,
+    SPECULATIVE_RESULT_TIMEOUT_SECONDS,
+    NS_PER_SECOND,
+    NS_PER_MILLISECOND,
+    NS_PER_MICROSECOND,
 )
 from resy_bot.models import (
     ResyConfig,
     ReservationRequest,
     TimedReservationRequest,
     ReservationRetriesConfig,
+    FindRequestBody,
+    PaymentMethod,
+    Slot,
 )
 from resy_bot.model_builders import (
     build_find_request_body,
@@ -22,20 +41,108 @@ from resy_bot.model_builders import (
     build_book_request_body,
 )
 from resy_bot.api_access import ResyApiAccess
+from resy_bot.retries import RetryOutcome, RetryState, TRANSITIONS, classify
 from resy_bot.selectors import AbstractSelector, SimpleSelector
 
 logger = logging.getLogger(__name__)
 logger.setLevel("INFO")
 
+FindCacheKey = Tuple[Optional[str], str, int]
+
+
+def find_cache_key(body: FindRequestBody) -> FindCacheKey:
+    return (body.venue_id, body.day, body.party_size)
+
+
+def wait_for_drop(drop_event: threading.Event, drop_epoch_ns: int) -> None:
+    """
+    park the calling thread until drop_event is set (by a timer firing at
+    the drop), falling back to the drop_epoch_ns deadline itself
+    """
+    drop_event.wait(timeout=max((drop_epoch_ns - time.time_ns()) / NS_PER_SECOND, 0))
+
+
+def compute_backoff(
+    schedule: Tuple[float, ...], attempt: int, max_delay: float, jitter: float
+) -> float:
+    """
+    look up the precomputed backoff for this attempt (the last entry repeats
+    once the schedule runs out), then stretch it by up to `jitter` so threads
+    that failed together don't all retry in lockstep, capped at max_delay
+    """
+    delay = schedule[min(attempt, len(schedule) - 1)]
+    return min(delay * (1 + random.random() * jitter), max_delay)
+
+
+class FindCache:
+    """
+    find results for a single make_reservation_with_retries run. identical
+    find requests made within FIND_CACHE_TTL_SECONDS of each other are
+    collapsed, and fallback finds can be sent ahead in the background.
+    every run gets its own, so watchlist threads sharing a manager never
+    read, clear or cancel each other's requests
+    """
+
+    def __init__(self, find_booking_slots: Callable[[FindRequestBody], List[Slot]]):
+        self._find_booking_slots = find_booking_slots
+        self._cache: Dict[FindCacheKey, Tuple[float, List[Slot]]] = {}
+        self._pending: Dict[FindCacheKey, "Future[List[Slot]]"] = {}
+
+    def get(self, body: FindRequestBody) -> List[Slot]:
+        key = find_cache_key(body)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            cached_at, cached_slots = cached
+            if time.monotonic() - cached_at < FIND_CACHE_TTL_SECONDS:
+                return cached_slots
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return pending.result()
+
+        return self._fetch(body)
+
+    def _fetch(self, body: FindRequestBody) -> List[Slot]:
+        slots = self._find_booking_slots(body)
+        self._cache[find_cache_key(body)] = (time.monotonic(), slots)
+        return slots
+
+    def prefetch(
+        self, executor: ThreadPoolExecutor, find_bodies: List[FindRequestBody]
+    ) -> None:
+        """
+        send the find requests for the fallback variants in the background,
+        without waiting on them; get picks each result up when the pass
+        reaches that variant. errors aren't cached, get surfaces them from
+        the pending future
+        """
+        for body in find_bodies:
+            self._pending[find_cache_key(body)] = executor.submit(self._fetch, body)
+
+    def clear(self) -> None:
+        """
+        forget every result, so a new retry pass never sees availability
+        from an earlier one. prefetches still in flight are waited out so
+        they can't land after the clear
+        """
+        pending = list(self._pending.values())
+        self._pending.clear()
+        wait(pending)
+        self._cache.clear()
+
 
 class ResyManager:
     @classmethod
-    def build(cls, config: ResyConfig) -> "ResyManager":
-        api_access = ResyApiAccess.build(config)
+    def build(
+        cls, config: ResyConfig, pool_maxsize: int = CONNECTIONS_PER_RESERVATION
+    ) -> "ResyManager":
+        api_access = ResyApiAccess.build(config, pool_maxsize)
         selector = SimpleSelector()
         retry_config = ReservationRetriesConfig(
             seconds_between_retries=SECONDS_TO_WAIT_BETWEEN_RETRIES,
             n_retries=N_RETRIES,
+            base_delay=SECONDS_TO_WAIT_BETWEEN_RETRIES,
         )
         return cls(config, api_access, selector, retry_config)
 
@@ -50,6 +157,17 @@ class ResyManager:
         self.api_access = api_access
         self.selector = slot_selector
         self.retry_config = retry_config
+        # config is frozen, so the payment method never changes per manager
+        self._payment_method = PaymentMethod(id=config.payment_method_id)
+
+    def __enter__(self) -> "ResyManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.api_access.close()
 
     def get_venue_id(self, address: str):
         """
@@ -59,28 +177,41 @@ class ResyManager:
         """
         pass
 
-    def make_reservation(self, reservation_request: ReservationRequest) -> str:
-        body = build_find_request_body(reservation_request)
+    def make_reservation(
+        self,
+        reservation_request: ReservationRequest,
+        find_body: Optional[FindRequestBody] = None,
+        find_cache: Optional[FindCache] = None,
+    ) -> str:
+        body = find_body or build_find_request_body(reservation_request)
 
-        slots = self.api_access.find_booking_slots(body)
-        logger.info(f"Returned: {slots}")
+        if find_cache is None:
+            slots = self.api_access.find_booking_slots(body)
+        else:
+            slots = find_cache.get(body)
+        logger.info("returned %d slots", len(slots))
+        logger.debug("slots=%s", slots)
 
         if len(slots) == 0:
             raise NoSlotsError("No Slots Found")
-        else:
-            logger.info(len(slots))
-            logger.info(slots)
 
+        return self._book_from_slots(reservation_request, slots)
+
+    def _book_from_slots(
+        self, reservation_request: ReservationRequest, slots: List[Slot]
+    ) -> str:
         selected_slot = self.selector.select(slots, reservation_request)
 
-        logger.info(selected_slot)
+        logger.info("%s", selected_slot)
         details_request = build_get_slot_details_body(
             reservation_request, selected_slot
         )
-        logger.info(details_request)
+        logger.info("%s", details_request)
         token = self.api_access.get_booking_token(details_request)
 
-        booking_request = build_book_request_body(token, self.config)
+        booking_request = build_book_request_body(
+            token, self.config, self._payment_method
+        )
 
         resy_token = self.api_access.book_slot(booking_request)
 
@@ -108,44 +239,112 @@ class ResyManager:
             }
         )
 
+    def _get_variants_to_try(
+        self, reservation_request: ReservationRequest
+    ) -> List[Tuple[date, int, ReservationRequest, FindRequestBody]]:
+        """
+        every (date, party size) combination to try, in priority order,
+        with its request and find body built once up front
+        """
+        variants = []
+        for target_date in self._get_dates_to_try(reservation_request):
+            for party_size in self._get_party_sizes_to_try(reservation_request):
+                modified = self._with_overrides(
+                    reservation_request, target_date, party_size
+                )
+                find_body = build_find_request_body(modified)
+                variants.append((target_date, party_size, modified, find_body))
+        return variants
+
     def make_reservation_with_retries(
         self, reservation_request: ReservationRequest
     ) -> str:
-        dates = self._get_dates_to_try(reservation_request)
-        party_sizes = self._get_party_sizes_to_try(reservation_request)
-
-        retries = 0
-        while retries < self.retry_config.n_retries:
-            server_error = False
-            for target_date in dates:
-                if server_error:
-                    break
-                for party_size in party_sizes:
-                    modified = self._with_overrides(reservation_request, target_date, party_size)
-                    try:
-                        return self.make_reservation(modified)
-                    except NoSlotsError:
-                        logger.info(
-                            f"no slots for party of {party_size} on {target_date}, "
-                            f"trying next option"
-                        )
-                        continue
-                    except ResyServerError:
-                        logger.warning(
-                            f"API returned 500 for venue {reservation_request.venue_id}, "
-                            f"waiting {SERVER_ERROR_RETRY_WAIT}s (not counted as retry)"
-                        )
-                        time.sleep(SERVER_ERROR_RETRY_WAIT)
-                        server_error = True
-                        break
-
-            if not server_error:
-                retries += 1
+        variants = self._get_variants_to_try(reservation_request)
+
+        unique_find_bodies = list(
+            {find_cache_key(body): body for _, _, _, body in variants}.values()
+        )
+        find_cache = FindCache(self.api_access.find_booking_slots)
+        executor = ThreadPoolExecutor(
+            max_workers=min(FIND_PREFETCH_MAX_WORKERS, len(unique_find_bodies))
+        )
+        try:
+            return self._retry_variants(
+                reservation_request,
+                variants,
+                unique_find_bodies,
+                find_cache,
+                executor,
+            )
+        finally:
+            # don't hold a booking until slower fallback finds come back
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _retry_variants(
+        self,
+        reservation_request: ReservationRequest,
+        variants: List[Tuple[date, int, ReservationRequest, FindRequestBody]],
+        unique_find_bodies: List[FindRequestBody],
+        find_cache: FindCache,
+        executor: ThreadPoolExecutor,
+    ) -> str:
+        state = RetryState(n_variants=len(variants))
+        while state.retries < self.retry_config.n_retries:
+            if state.variant_index == 0:
+                find_cache.clear()
+                # the primary variant's find goes out from this thread
+                find_cache.prefetch(executor, unique_find_bodies[1:])
+
+            target_date, party_size, modified, find_body = variants[state.variant_index]
+            try:
+                return self.make_reservation(
+                    modified, find_body=find_body, find_cache=find_cache
+                )
+            except Exception as e:
+                outcome = classify(e)
+                if outcome is RetryOutcome.FAIL:
+                    raise
+
+            next_state = TRANSITIONS[outcome](state)
+
+            if outcome is RetryOutcome.RETRY_NO_INCREMENT:
+                delay = compute_backoff(
+                    self.retry_config.server_error_backoff_schedule,
+                    state.server_errors,
+                    self.retry_config.max_delay,
+                    self.retry_config.jitter,
+                )
+                logger.warning(
+                    "API returned 500 for venue %s, "
+                    "waiting %.2fs (not counted as retry)",
+                    reservation_request.venue_id,
+                    delay,
+                )
+                sleep(delay)
+            else:
                 logger.info(
-                    f"no slots found ({retries}/{self.retry_config.n_retries}); "
-                    f"currently {datetime.now().isoformat()}"
+                    "no slots for party of %s on %s, trying next option",
+                    party_size,
+                    target_date,
                 )
-                time.sleep(self.retry_config.seconds_between_retries)
+
+            if next_state.retries > state.retries:
+                logger.info(
+                    "no slots found (%s/%s); currently %s",
+                    next_state.retries,
+                    self.retry_config.n_retries,
+                    datetime.now().isoformat(),
+                )
+                sleep(
+                    compute_backoff(
+                        self.retry_config.backoff_schedule,
+                        state.retries,
+                        self.retry_config.max_delay,
+                        self.retry_config.jitter,
+                    )
+                )
+
+            state = next_state
 
         raise ExhaustedRetriesError(
             f"Retried {self.retry_config.n_retries} times, without finding a slot"
@@ -161,23 +360,128 @@ class ResyManager:
             minute=reservation_request.expected_drop_minute,
         ) - timedelta(seconds=EARLY_START_SECONDS)
 
+    def _get_drop_epoch_ns(self, reservation_request: TimedReservationRequest) -> int:
+        """
+        drop time as integer nanoseconds since the epoch, computed once so
+        the waiting code never has to touch datetime again
+        """
+        drop_time = self._get_drop_time(reservation_request)
+        return (
+            int(drop_time.timestamp()) * NS_PER_SECOND
+            + drop_time.microsecond * NS_PER_MICROSECOND
+        )
+
+    def _wait_until(self, target_epoch_ns: int) -> None:
+        """
+        sleep until just before target_epoch_ns, then spin for the last few
+        milliseconds, since a sleep can overshoot the target by a tick.
+        the target is mapped onto the monotonic clock once up front, so the
+        loop only compares integers and can't be thrown off by NTP steps
+        """
+        offset_ns = time.monotonic_ns() - time.time_ns()
+        deadline_ns = target_epoch_ns + offset_ns
+        fine_wait_ns = int(FINE_WAIT_SECONDS * NS_PER_SECOND)
+
+        remaining_ns = deadline_ns - time.monotonic_ns()
+        while remaining_ns > fine_wait_ns:
+            coarse_wait = (remaining_ns - fine_wait_ns) / NS_PER_SECOND
+            sleep(min(coarse_wait, WAIT_LOG_INTERVAL_SECONDS))
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns > fine_wait_ns:
+                logger.info("%s: still waiting", datetime.now())
+
+        while time.monotonic_ns() < deadline_ns:
+            pass
+
+    def _wait_for_stage(
+        self,
+        stage_epoch_ns: int,
+        drop_epoch_ns: int,
+        drop_event: Optional[threading.Event],
+    ) -> bool:
+        """
+        wait until stage_epoch_ns, some point ahead of the drop. returns False
+        if the drop has already been reached and the stage should be skipped
+        """
+        if drop_event is not None:
+            timeout = max((stage_epoch_ns - time.time_ns()) / NS_PER_SECOND, 0)
+            return not drop_event.wait(timeout=timeout)
+
+        self._wait_until(stage_epoch_ns)
+        return time.time_ns() < drop_epoch_ns
+
+    def _book_speculative_slots(
+        self,
+        reservation_request: ReservationRequest,
+        speculative_find: "Future[List[Slot]]",
+    ) -> Optional[str]:
+        """
+        book from a find request fired just ahead of the drop, returning None
+        if it found nothing usable so the caller falls back to the retry loop
+        """
+        try:
+            slots = speculative_find.result(timeout=SPECULATIVE_RESULT_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.info("speculative find unusable: %r", e)
+            return None
+
+        if not slots:
+            logger.info("speculative find returned no slots")
+            return None
+
+        try:
+            return self._book_from_slots(reservation_request, slots)
+        except (NoSlotsError, RequestException) as e:
+            logger.info("speculative booking failed: %r", e)
+            return None
+
     def make_reservation_at_opening_time(
-        self, reservation_request: TimedReservationRequest
+        self,
+        reservation_request: TimedReservationRequest,
+        drop_event: Optional[threading.Event] = None,
     ) -> str:
         """
-        cycle until we hit the opening time, then run & return the reservation
+        wait until we hit the opening time, then run & return the reservation
+        if a drop_event is shared across threads, block on it instead of
+        polling the clock from every thread
         """
-        drop_time = self._get_drop_time(reservation_request)
-        last_check = datetime.now()
-
-        while True:
-            if datetime.now() < drop_time:
-                if datetime.now() - last_check > timedelta(seconds=10):
-                    logger.info(f"{datetime.now()}: still waiting")
-                    last_check = datetime.now()
-                continue
-
-            logger.info(f"time reached, making a reservation now! {datetime.now()}")
-            return self.make_reservation_with_retries(
-                reservation_request.reservation_request
-            )
+        drop_epoch_ns = self._get_drop_epoch_ns(reservation_request)
+        warm_up_epoch_ns = drop_epoch_ns - WARM_UP_LEAD_SECONDS * NS_PER_SECOND
+
+        if self._wait_for_stage(warm_up_epoch_ns, drop_epoch_ns, drop_event):
+            # started too close to the drop for a warm up that could block
+            # up to its timeout; the first find sets up the connection instead
+            warm_up_timeout_ns = int(WARM_UP_TIMEOUT_SECONDS * NS_PER_SECOND)
+            if drop_epoch_ns - time.time_ns() > warm_up_timeout_ns:
+                self.api_access.warm_up()
+
+        # fire the primary find request slightly ahead of the drop, since
+        # slots are sometimes published a tick early
+        speculative = None
+        lead_ms = reservation_request.speculative_lead_ms
+        if lead_ms:
+            speculative_epoch_ns = drop_epoch_ns - lead_ms * NS_PER_MILLISECOND
+            if self._wait_for_stage(speculative_epoch_ns, drop_epoch_ns, drop_event):
+                _, _, primary_request, find_body = self._get_variants_to_try(
+                    reservation_request.reservation_request
+                )[0]
+                executor = ThreadPoolExecutor(max_workers=1)
+                future = executor.submit(self.api_access.find_booking_slots, find_body)
+                executor.shutdown(wait=False)
+                speculative = (primary_request, future)
+
+        if drop_event is not None:
+            wait_for_drop(drop_event, drop_epoch_ns)
+        else:
+            self._wait_until(drop_epoch_ns)
+
+        logger.info("time reached, making a reservation now! %s", datetime.now())
+
+        if speculative is not None:
+            resy_token = self._book_speculative_slots(*speculative)
+            if resy_token is not None:
+                return resy_token
+
+        return self.make_reservation_with_retries(
+            reservation_request.reservation_request
+        )
@@ -1,4 +1,5 @@
-from datetime import date
+from typing import Optional
+
 from resy_bot.models import (
     ReservationRequest,
     AuthRequestBody,
@@ -13,22 +14,21 @@ from resy_bot.models import (
 
 
 def build_find_request_body(reservation: ReservationRequest) -> FindRequestBody:
-    day = date.strftime(reservation.target_date, "%Y-%m-%d")
-
     return FindRequestBody(
-        venue_id=reservation.venue_id, party_size=reservation.party_size, day=day
+        venue_id=reservation.venue_id,
+        party_size=reservation.party_size,
+        day=reservation.day_str,
     )
 
 
 def build_get_slot_details_body(
     reservation: ReservationRequest, slot: Slot
 ) -> DetailsRequestBody:
-    day = date.strftime(reservation.target_date, "%Y-%m-%d")
     config_id = slot.config.token
 
     return DetailsRequestBody(
         config_id=config_id,
-        day=day,
+        day=reservation.day_str,
         party_size=reservation.party_size,
     )
 
@@ -38,9 +38,12 @@ def build_auth_request_body(config: ResyConfig) -> AuthRequestBody:
 
 
 def build_book_request_body(
-    details: DetailsResponseBody, config: ResyConfig
+    details: DetailsResponseBody,
+    config: ResyConfig,
+    payment_method: Optional[PaymentMethod] = None,
 ) -> BookRequestBody:
-    payment_method = PaymentMethod(id=config.payment_method_id)
+    if payment_method is None:
+        payment_method = PaymentMethod(id=config.payment_method_id)
     return BookRequestBody(
         book_token=details.book_token.value, struct_payment_method=payment_method
     )
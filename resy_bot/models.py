@@ -1,7 +1,16 @@
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 
-from pydantic import BaseModel, validator, root_validator
+from pydantic import BaseModel, Field, validator, root_validator
+
+from resy_bot.constants import (
+    BACKOFF_CAP_SECONDS,
+    BACKOFF_JITTER,
+    BACKOFF_MAX_EXPONENT,
+    SEARCH_CACHE_PATH,
+    SERVER_ERROR_RETRY_WAIT,
+)
 
 
 class NotificationsConfig(BaseModel):
@@ -16,6 +25,12 @@ class ResyConfig(BaseModel):
     email: str
     password: str
     gmail_app_password: Optional[str] = None
+    notification_rate_per_second: float = Field(1.0, gt=0)
+    notification_burst: int = Field(5, ge=1)
+    search_cache_path: str = SEARCH_CACHE_PATH
+
+    class Config:
+        frozen = True
 
     def get_authorization(self) -> str:
         return f'ResyAPI api_key="{self.api_key}"'
@@ -34,6 +49,9 @@ class ReservationRequest(BaseModel):
     fallback_party_sizes: Optional[List[int]] = None
     date_range: Optional[int] = None
 
+    class Config:
+        frozen = True
+
     @root_validator
     def validate_target_date(cls, data: Dict) -> Dict:
         has_date = data["ideal_date"] is not None
@@ -56,10 +74,47 @@ class ReservationRequest(BaseModel):
 
         raise ValueError("No date")
 
+    @property
+    def day_str(self) -> str:
+        return self.target_date.isoformat()
+
 
 class ReservationRetriesConfig(BaseModel):
     seconds_between_retries: float
     n_retries: int
+    base_delay: float
+    max_delay: float = BACKOFF_CAP_SECONDS
+    jitter: float = BACKOFF_JITTER
+    server_error_base_delay: float = SERVER_ERROR_RETRY_WAIT
+
+    class Config:
+        frozen = True
+
+    @root_validator(pre=True)
+    def default_base_delay(cls, values: Dict) -> Dict:
+        if values.get("base_delay") is None:
+            values["base_delay"] = values.get("seconds_between_retries")
+        return values
+
+    @property
+    def backoff_schedule(self) -> Tuple[float, ...]:
+        """
+        un-jittered wait after each empty pass, doubling from base_delay
+        until the exponent cap, then flat
+        """
+        return _build_backoff_schedule(self.base_delay, self.max_delay)
+
+    @property
+    def server_error_backoff_schedule(self) -> Tuple[float, ...]:
+        return _build_backoff_schedule(self.server_error_base_delay, self.max_delay)
+
+
+@lru_cache(maxsize=None)
+def _build_backoff_schedule(base: float, max_delay: float) -> Tuple[float, ...]:
+    return tuple(
+        min(base * 2**exponent, max_delay)
+        for exponent in range(BACKOFF_MAX_EXPONENT + 1)
+    )
 
 
 class TimedReservationRequest(BaseModel):
@@ -67,6 +122,7 @@ class TimedReservationRequest(BaseModel):
     expected_drop_hour: int
     expected_drop_minute: int
     notifications: Optional[NotificationsConfig] = None
+    speculative_lead_ms: Optional[int] = Field(None, gt=0)
 
 
 class WatchlistEntry(BaseModel):
@@ -75,6 +131,7 @@ class WatchlistEntry(BaseModel):
     expected_drop_hour: int
     expected_drop_minute: int
     notifications: Optional[NotificationsConfig] = None
+    speculative_lead_ms: Optional[int] = Field(None, gt=0)
 
     def to_timed_request(self) -> TimedReservationRequest:
         return TimedReservationRequest(
@@ -82,6 +139,7 @@ class WatchlistEntry(BaseModel):
             expected_drop_hour=self.expected_drop_hour,
             expected_drop_minute=self.expected_drop_minute,
             notifications=self.notifications,
+            speculative_lead_ms=self.speculative_lead_ms,
         )
 
 
@@ -97,6 +155,11 @@ class AuthRequestBody(BaseModel):
 class PaymentMethod(BaseModel):
     id: int
 
+    class Config:
+        frozen = True
+        # immutable, so models holding one can share it instead of copying
+        copy_on_model_validation = "none"
+
 
 class AuthResponseBody(BaseModel):
     payment_methods: List[PaymentMethod]
@@ -110,6 +173,9 @@ class FindRequestBody(BaseModel):
     party_size: int
     venue_id: Optional[str]
 
+    class Config:
+        frozen = True
+
     @validator("day")
     def validate_day(cls, day: str) -> str:
         try:
@@ -153,6 +219,9 @@ class DetailsRequestBody(BaseModel):
     party_size: int
     day: str
 
+    class Config:
+        frozen = True
+
 
 class BookToken(BaseModel):
     date_expires: datetime
@@ -168,6 +237,9 @@ class BookRequestBody(BaseModel):
     struct_payment_method: PaymentMethod
     source_id: str = "resy.com-venue-details"
 
+    class Config:
+        frozen = True
+
 
 class BookResponseBody(BaseModel):
     resy_token: str
@@ -1,11 +1,124 @@
 import logging
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 SMTP_HOST = "smtp.gmail.com"
 SMTP_PORT = 587
+DEFAULT_RATE_PER_SECOND = 1.0
+DEFAULT_BURST = 5
+RATE_LIMIT_TIMEOUT_SECONDS = 30.0
+
+
+class RateLimiter:
+    """
+    token bucket shared by every sender in the process, so a burst of
+    notifications right after a drop doesn't get the account throttled
+    """
+
+    def __init__(self, rate_per_second: float, burst: int):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        if burst < 1:
+            raise ValueError("burst must allow at least one message")
+
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._last) * self.rate_per_second,
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate_per_second
+
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+_limiter = RateLimiter(DEFAULT_RATE_PER_SECOND, DEFAULT_BURST)
+
+
+def configure_rate_limit(rate_per_second: float, burst: int) -> None:
+    global _limiter
+    _limiter = RateLimiter(rate_per_second, burst)
+
+
+class SMTPClient:
+    """
+    keeps a single authenticated SMTP connection open so a batch of
+    notifications only pays for STARTTLS + login once. connects lazily on
+    the first send and reconnects if the server has dropped the connection
+    """
+
+    def __init__(self, from_email: str, app_password: Optional[str]):
+        self.from_email = from_email
+        self.app_password = app_password
+        self._server: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SMTPClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.app_password is None:
+            raise ValueError("No gmail_app_password configured for SMTP login")
+
+        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+        try:
+            server.starttls()
+            server.login(self.from_email, self.app_password)
+        except Exception:
+            # a failed handshake (e.g. a bad app password) mustn't leave the
+            # socket open behind it
+            server.close()
+            raise
+        self._server = server
+        return server
+
+    def _disconnect(self) -> None:
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            # quit only closes the socket once the server has answered
+            self._server.close()
+        self._server = None
+
+    def sendmail(self, to_email: str, message: str) -> None:
+        with self._lock:
+            server = self._server or self._connect()
+            try:
+                server.sendmail(self.from_email, to_email, message)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # only a dropped connection is worth a fresh login, errors
+                # about the message itself (refused recipients etc.) propagate
+                self._disconnect()
+                self._connect().sendmail(self.from_email, to_email, message)
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
 
 
 def send_email(
@@ -14,12 +127,20 @@ def send_email(
     to_email: str,
     from_email: str,
     app_password: str,
+    smtp_client: Optional[SMTPClient] = None,
 ) -> None:
     msg = MIMEText(body)
     msg["Subject"] = subject
     msg["From"] = from_email
     msg["To"] = to_email
 
+    if not _limiter.acquire(timeout=RATE_LIMIT_TIMEOUT_SECONDS):
+        raise TimeoutError("Timed out waiting for the notification rate limit")
+
+    if smtp_client is not None:
+        smtp_client.sendmail(to_email, msg.as_string())
+        return
+
     with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
         server.starttls()
         server.login(from_email, app_password)
@@ -32,6 +153,7 @@ def notify_booking_result(
     notifications_config,
     gmail_app_password: str,
     from_email: str,
+    smtp_client: Optional[SMTPClient] = None,
 ) -> None:
     if not notifications_config or not notifications_config.enabled:
         return
@@ -50,7 +172,8 @@ def notify_booking_result(
             to_email=notifications_config.email,
             from_email=from_email,
             app_password=gmail_app_password,
+            smtp_client=smtp_client,
         )
-        logger.info(f"Notification email sent to {notifications_config.email}")
+        logger.info("Notification email sent to %s", notifications_config.email)
     except Exception as e:
-        logger.error(f"Failed to send notification email: {e}")
+        logger.error("Failed to send notification email: %s", e)
@@ -0,0 +1,53 @@
+from enum import Enum
+from typing import Callable, Dict, NamedTuple
+
+from resy_bot.errors import NoSlotsError, ResyServerError
+
+
+class RetryOutcome(Enum):
+    NEXT_VARIANT = "next_variant"
+    RETRY_NO_INCREMENT = "retry_no_increment"
+    FAIL = "fail"
+
+
+class RetryState(NamedTuple):
+    """
+    position in the retry loop: which (date, party size) variant is up
+    next, how many full passes have come up empty, and how many server
+    errors have been seen (those restart the pass but don't count)
+    """
+
+    n_variants: int
+    variant_index: int = 0
+    retries: int = 0
+    server_errors: int = 0
+
+
+def classify(exc: Exception) -> RetryOutcome:
+    if isinstance(exc, NoSlotsError):
+        return RetryOutcome.NEXT_VARIANT
+    if isinstance(exc, ResyServerError):
+        return RetryOutcome.RETRY_NO_INCREMENT
+    return RetryOutcome.FAIL
+
+
+def _complete_pass(state: RetryState) -> RetryState:
+    # a server error restarts the pass, so a completed pass saw none and the
+    # server error backoff can start over
+    return state._replace(variant_index=0, retries=state.retries + 1, server_errors=0)
+
+
+def _retry_no_increment(state: RetryState) -> RetryState:
+    return state._replace(variant_index=0, server_errors=state.server_errors + 1)
+
+
+def _next_variant(state: RetryState) -> RetryState:
+    if state.variant_index + 1 < state.n_variants:
+        return state._replace(variant_index=state.variant_index + 1)
+    return _complete_pass(state)
+
+
+TRANSITIONS: Dict[RetryOutcome, Callable[[RetryState], RetryState]] = {
+    RetryOutcome.NEXT_VARIANT: _next_variant,
+    RetryOutcome.RETRY_NO_INCREMENT: _retry_no_increment,
+}
@@ -0,0 +1,46 @@
+import hashlib
+import os
+import shelve
+import threading
+import time
+from typing import Dict, List, Optional
+
+from resy_bot.constants import SEARCH_CACHE_TTL_SECONDS
+
+
+class VenueSearchCache:
+    """
+    on-disk cache of venue search results, keyed by the normalised query.
+    expired entries are kept so they can still be served if the search
+    endpoint is unavailable
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = SEARCH_CACHE_TTL_SECONDS):
+        self.path = os.path.expanduser(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return hashlib.sha256(query.lower().strip().encode()).hexdigest()
+
+    def _open(self) -> shelve.Shelf:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        return shelve.open(self.path)
+
+    def get(self, query: str, allow_stale: bool = False) -> Optional[List[Dict]]:
+        with self._lock, self._open() as db:
+            entry = db.get(self._key(query))
+
+        if entry is None:
+            return None
+
+        stored_at, results = entry
+        if not allow_stale and time.time() - stored_at > self.ttl_seconds:
+            return None
+
+        return results
+
+    def set(self, query: str, results: List[Dict]) -> None:
+        with self._lock, self._open() as db:
+            db[self._key(query)] = (time.time(), results)
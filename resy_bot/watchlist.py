@@ -1,10 +1,20 @@
 import logging
 import threading
-from typing import List
+import time
+from typing import Dict, List
 
+from resy_bot.constants import (
+    CONNECTIONS_PER_RESERVATION,
+    HTTP_POOL_MAXSIZE,
+    NS_PER_SECOND,
+)
 from resy_bot.models import ResyConfig, WatchlistEntry, Watchlist
 from resy_bot.manager import ResyManager
-from resy_bot.notifications import notify_booking_result
+from resy_bot.notifications import (
+    SMTPClient,
+    configure_rate_limit,
+    notify_booking_result,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -13,15 +23,19 @@ def _run_single_venue(
     manager: ResyManager,
     entry: WatchlistEntry,
     config: ResyConfig,
+    drop_event: threading.Event,
+    smtp_client: SMTPClient,
 ) -> None:
     venue_label = entry.name or f"venue {entry.reservation_request.venue_id}"
-    logger.info(f"[{venue_label}] Thread started, waiting for drop time")
+    logger.info("[%s] Thread started, waiting for drop time", venue_label)
 
     timed_request = entry.to_timed_request()
 
     try:
-        resy_token = manager.make_reservation_at_opening_time(timed_request)
-        logger.info(f"[{venue_label}] Booking successful! Token: {resy_token}")
+        resy_token = manager.make_reservation_at_opening_time(
+            timed_request, drop_event=drop_event
+        )
+        logger.info("[%s] Booking successful! Token: %s", venue_label, resy_token)
 
         notify_booking_result(
             success=True,
@@ -38,10 +52,11 @@ def _run_single_venue(
             notifications_config=entry.notifications,
             gmail_app_password=config.gmail_app_password,
             from_email=config.email,
+            smtp_client=smtp_client,
         )
 
     except Exception as e:
-        logger.error(f"[{venue_label}] Booking failed: {e}")
+        logger.error("[%s] Booking failed: %s", venue_label, e)
 
         notify_booking_result(
             success=False,
@@ -56,27 +71,56 @@ def _run_single_venue(
             notifications_config=entry.notifications,
             gmail_app_password=config.gmail_app_password,
             from_email=config.email,
+            smtp_client=smtp_client,
         )
 
 
 def run_watchlist(config: ResyConfig, watchlist: Watchlist) -> None:
-    manager = ResyManager.build(config)
+    configure_rate_limit(config.notification_rate_per_second, config.notification_burst)
+    # every venue thread can run a full reservation at once on the shared pool
+    manager = ResyManager.build(
+        config,
+        pool_maxsize=max(
+            len(watchlist.venues) * CONNECTIONS_PER_RESERVATION, HTTP_POOL_MAXSIZE
+        ),
+    )
 
+    # one timer per distinct drop time sets an event that all venue threads
+    # dropping at that time block on, so only the timer watches the clock
+    drop_events: Dict[int, threading.Event] = {}
+    timers: List[threading.Timer] = []
     threads: List[threading.Thread] = []
+    smtp_client = SMTPClient(config.email, config.gmail_app_password)
     for entry in watchlist.venues:
+        drop_epoch_ns = manager._get_drop_epoch_ns(entry.to_timed_request())
+        if drop_epoch_ns not in drop_events:
+            drop_event = threading.Event()
+            timer = threading.Timer(
+                max((drop_epoch_ns - time.time_ns()) / NS_PER_SECOND, 0),
+                drop_event.set,
+            )
+            timer.daemon = True
+            drop_events[drop_epoch_ns] = drop_event
+            timers.append(timer)
+
         venue_label = entry.name or f"venue {entry.reservation_request.venue_id}"
         t = threading.Thread(
             target=_run_single_venue,
-            args=(manager, entry, config),
+            args=(manager, entry, config, drop_events[drop_epoch_ns], smtp_client),
             name=f"resy-{venue_label}",
         )
         threads.append(t)
 
-    logger.info(f"Starting {len(threads)} venue thread(s)")
-    for t in threads:
-        t.start()
+    logger.info("Starting %d venue thread(s)", len(threads))
+    for timer in timers:
+        timer.start()
+    with manager, smtp_client:
+        for t in threads:
+            t.start()
 
-    for t in threads:
-        t.join()
+        for t in threads:
+            t.join()
+    for timer in timers:
+        timer.cancel()
 
     logger.info("All venue threads completed")
@@ -0,0 +1,30 @@
+import pytest
+
+from resy_bot.models import ResyConfig, ReservationRetriesConfig
+
+from tests.factories import ResyConfigFactory, ReservationRetriesConfigFactory
+
+
+@pytest.fixture(autouse=True)
+def _fast_sleep(request, monkeypatch) -> None:
+    """
+    resy_bot.manager's retry and drop waits return immediately unless a test
+    is marked real_sleep. only the manager's own sleep is replaced, so
+    time.sleep elsewhere in the process is untouched
+    """
+    if request.node.get_closest_marker("real_sleep") is None:
+        monkeypatch.setattr("resy_bot.manager.sleep", lambda seconds: None)
+
+
+@pytest.fixture(scope="session")
+def config() -> ResyConfig:
+    """
+    shared across the session, ResyConfig is frozen so a test can't leak
+    changes into the next one
+    """
+    return ResyConfigFactory.create()
+
+
+@pytest.fixture(scope="session")
+def retries_config() -> ReservationRetriesConfig:
+    return ReservationRetriesConfigFactory.create()
@@ -0,0 +1,109 @@
+import smtplib
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from resy_bot.models import (
+    BookRequestBody,
+    DetailsRequestBody,
+    DetailsResponseBody,
+    FindRequestBody,
+    ReservationRequest,
+    Slot,
+)
+
+
+@dataclass
+class FakeApiAccess:
+    """
+    stands in for ResyApiAccess, returning canned responses and recording
+    each call as (method name, argument) in the order it was made
+    """
+
+    find_booking_slots_return: List[Slot] = field(default_factory=list)
+    get_booking_token_return: Optional[DetailsResponseBody] = None
+    book_slot_return: str = ""
+    calls: List[Tuple[str, Any]] = field(default_factory=list)
+
+    @property
+    def find_calls(self) -> List[FindRequestBody]:
+        return [arg for name, arg in self.calls if name == "find_booking_slots"]
+
+    @property
+    def book_slot_calls(self) -> List[BookRequestBody]:
+        return [arg for name, arg in self.calls if name == "book_slot"]
+
+    def find_booking_slots(self, params: FindRequestBody) -> List[Slot]:
+        self.calls.append(("find_booking_slots", params))
+        return self.find_booking_slots_return
+
+    def get_booking_token(self, params: DetailsRequestBody) -> DetailsResponseBody:
+        self.calls.append(("get_booking_token", params))
+        return self.get_booking_token_return
+
+    def book_slot(self, body: BookRequestBody) -> str:
+        self.calls.append(("book_slot", body))
+        return self.book_slot_return
+
+    def warm_up(self) -> None:
+        self.calls.append(("warm_up", None))
+
+
+@dataclass
+class FakeSelector:
+    """
+    pass the api fake's `calls` list in to record selections alongside
+    the api calls
+    """
+
+    select_return: Optional[Slot] = None
+    calls: List[Tuple[str, Any]] = field(default_factory=list)
+
+    def select(self, slots: List[Slot], request: ReservationRequest) -> Slot:
+        self.calls.append(("select", (slots, request)))
+        return self.select_return
+
+
+class FakeSMTP:
+    """
+    stands in for smtplib.SMTP; sendmail_error, if set, is raised from every
+    sendmail and quit, like a connection the server has dropped. login_error,
+    if set, is raised from login, like a rejected password
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sendmail_error: Optional[Exception] = None,
+        login_error: Optional[Exception] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.sendmail_error = sendmail_error
+        self.login_error = login_error
+        self.logins: List[Tuple[str, str]] = []
+        self.sent: List[Tuple[str, str, str]] = []
+        self.quit_called = False
+        self.closed = False
+
+    def starttls(self) -> None:
+        pass
+
+    def login(self, user: str, password: str) -> None:
+        self.logins.append((user, password))
+        if self.login_error is not None:
+            raise self.login_error
+
+    def sendmail(self, from_addr: str, to_addrs: str, msg: str) -> None:
+        if self.sendmail_error is not None:
+            raise self.sendmail_error
+        self.sent.append((from_addr, to_addrs, msg))
+
+    def quit(self) -> None:
+        if self.sendmail_error is not None:
+            raise smtplib.SMTPServerDisconnected("connection closed")
+        self.quit_called = True
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
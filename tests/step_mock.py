@@ -0,0 +1,34 @@
+from typing import Any, Iterable, List, Tuple
+
+
+class StepMock:
+    """
+    callable that plays back scripted (label, outcome) steps, one per call.
+    an exception class is only instantiated, with the label as its message,
+    once its step is reached; any other outcome is returned as is
+    """
+
+    def __init__(self, steps: Iterable[Tuple[str, Any]]):
+        self._steps = iter(steps)
+        self.labels: List[str] = []
+        self.calls: List[Tuple[tuple, dict]] = []
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        self.calls.append((args, kwargs))
+        try:
+            label, outcome = next(self._steps)
+        except StopIteration:
+            raise AssertionError(
+                f"called {self.call_count} times, past the scripted steps"
+            )
+
+        self.labels.append(label)
+        if isinstance(outcome, type) and issubclass(outcome, BaseException):
+            raise outcome(label)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
@@ -1,11 +1,11 @@
 import pytest
-from requests import HTTPError
+from requests import HTTPError, ConnectionError
 from unittest.mock import MagicMock
 from requests import Session
 
 from resy_bot.api_access import build_session, ResyApiAccess
+from resy_bot.search_cache import VenueSearchCache
 from tests.factories import (
-    ResyConfigFactory,
     AuthRequestBodyFactory,
     AuthResponseBodyFactory,
     FindRequestBodyFactory,
@@ -17,8 +17,7 @@ from tests.factories import (
 )
 
 
-def test_build_session():
-    config = ResyConfigFactory.create()
+def test_build_session(config):
     session = build_session(config)
 
     assert isinstance(session, Session)
@@ -26,8 +25,7 @@ def test_build_session():
     assert session.headers["X-Resy-Auth-Token"] == config.token
 
 
-def test_build_api_access():
-    config = ResyConfigFactory.create()
+def test_build_api_access(config):
     api_access = ResyApiAccess.build(config)
 
     assert isinstance(api_access, ResyApiAccess)
@@ -187,3 +185,100 @@ def test_book_slot_bad_resp():
 
     with pytest.raises(HTTPError):
         api_access.book_slot(body)
+
+
+def test_build_session_pool_size(config):
+    session = build_session(config, pool_maxsize=25)
+
+    assert session.get_adapter("https://api.resy.com")._pool_maxsize == 25
+
+
+def test_warm_up():
+    session = MagicMock()
+    api_access = ResyApiAccess(session)
+
+    api_access.warm_up()
+
+    session.get.assert_called_once_with("https://api.resy.com/", timeout=2.0)
+
+
+def test_close_closes_session():
+    session = MagicMock()
+
+    with ResyApiAccess(session) as api_access:
+        api_access.warm_up()
+        session.close.assert_not_called()
+
+    session.close.assert_called_once()
+
+
+def test_warm_up_swallows_connection_errors():
+    session = MagicMock()
+    session.get.side_effect = ConnectionError("unreachable")
+    api_access = ResyApiAccess(session)
+
+    api_access.warm_up()
+
+
+def test_search_venues_batch():
+    session = MagicMock()
+    resp_mock = MagicMock()
+    resp_mock.json.return_value = {"search": {"hits": []}}
+    session.post.return_value = resp_mock
+
+    api_access = ResyApiAccess(session)
+
+    results = dict(api_access.search_venues_batch(["carbone", "lilia"]))
+
+    assert results == {"carbone": [], "lilia": []}
+    assert session.post.call_count == 2
+
+
+def test_search_venues_batch_keeps_going_after_a_failed_query():
+    session = MagicMock()
+    ok_resp = MagicMock()
+    ok_resp.json.return_value = {"search": {"hits": []}}
+    bad_resp = MagicMock(ok=False, status_code=500, text="error")
+
+    def post(url, json, headers):
+        return bad_resp if json["query"] == "carbone" else ok_resp
+
+    session.post.side_effect = post
+
+    api_access = ResyApiAccess(session)
+
+    results = dict(api_access.search_venues_batch(["carbone", "lilia"]))
+
+    assert results == {"carbone": None, "lilia": []}
+
+
+def test_search_venues_uses_cache(tmp_path):
+    session = MagicMock()
+    resp_mock = MagicMock()
+    resp_mock.json.return_value = {"search": {"hits": [{"name": "Carbone"}]}}
+    session.post.return_value = resp_mock
+
+    cache = VenueSearchCache(str(tmp_path / "search_cache"))
+    api_access = ResyApiAccess(session, cache)
+
+    first = api_access.search_venues("Carbone")
+    second = api_access.search_venues("  carbone ")
+
+    assert first == second
+    session.post.assert_called_once()
+
+
+def test_search_venues_falls_back_to_stale_cache(tmp_path):
+    session = MagicMock()
+    resp_mock = MagicMock()
+    resp_mock.json.return_value = {"search": {"hits": [{"name": "Carbone"}]}}
+    session.post.return_value = resp_mock
+
+    cache = VenueSearchCache(str(tmp_path / "search_cache"), ttl_seconds=0)
+    api_access = ResyApiAccess(session, cache)
+
+    expected = api_access.search_venues("carbone")
+
+    resp_mock.ok = False
+    assert api_access.search_venues("carbone") == expected
+    assert session.post.call_count == 2
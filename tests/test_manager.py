@@ -1,6 +1,10 @@
 from datetime import datetime, timedelta
+import threading
+import time
 import pytest
-from unittest.mock import MagicMock, patch
+from freezegun import freeze_time
+from pydantic import ValidationError
+from unittest.mock import patch
 
 from resy_bot.errors import NoSlotsError, ExhaustedRetriesError, ResyServerError
 from resy_bot.api_access import ResyApiAccess
@@ -10,54 +14,50 @@ from resy_bot.models import (
     BookRequestBody,
     PaymentMethod,
     ReservationRetriesConfig,
+    WatchlistEntry,
 )
-from resy_bot.manager import ResyManager
+from resy_bot.manager import FindCache, ResyManager, compute_backoff
 
 from tests.factories import (
-    ResyConfigFactory,
     SlotFactory,
     ReservationRequestFactory,
     DetailsResponseBodyFactory,
-    ReservationRetriesConfigFactory,
     TimedReservationRequestFactory,
     ReservationRequestDaysInAdvanceFactory,
 )
+from tests.fakes import FakeApiAccess, FakeSelector
+from tests.step_mock import StepMock
 
 
-def test_build():
-    config = ResyConfigFactory.create()
+def test_build(config):
     manager = ResyManager.build(config)
 
     assert isinstance(manager, ResyManager)
     assert isinstance(manager.api_access, ResyApiAccess)
 
 
-def test_make_reservation():
-    config = ResyConfigFactory.create()
-    retries_config = ReservationRetriesConfigFactory.create()
+def test_make_reservation(config, retries_config):
     request = ReservationRequestFactory.create()
-    mock_api_access = MagicMock()
-    slots = SlotFactory.create_batch(3)
-    mock_api_access.find_booking_slots.return_value = slots
-
+    slot = SlotFactory.create()
+    slots = [slot]
     details_response = DetailsResponseBodyFactory.create()
-    mock_api_access.get_booking_token.return_value = details_response
-
-    mock_selector = MagicMock()
-    mock_selector.select.return_value = slots[0]
+    api_access = FakeApiAccess(
+        find_booking_slots_return=slots, get_booking_token_return=details_response
+    )
+    selector = FakeSelector(select_return=slot, calls=api_access.calls)
 
-    manager = ResyManager(config, mock_api_access, mock_selector, retries_config)
+    manager = ResyManager(config, api_access, selector, retries_config)
 
     manager.make_reservation(request)
 
-    expected_day = request.ideal_date.strftime("%Y-%m-%d")
+    expected_day = request.ideal_date.isoformat()
 
     expected_find_request_body = FindRequestBody(
         venue_id=request.venue_id, party_size=request.party_size, day=expected_day
     )
 
     expected_details_request_body = DetailsRequestBody(
-        config_id=slots[0].config.token, day=expected_day, party_size=request.party_size
+        config_id=slot.config.token, day=expected_day, party_size=request.party_size
     )
 
     expected_booking_request = BookRequestBody(
@@ -65,45 +65,36 @@ def test_make_reservation():
         struct_payment_method=PaymentMethod(id=config.payment_method_id),
     )
 
-    mock_api_access.find_booking_slots.assert_called_once_with(
-        expected_find_request_body
-    )
-
-    mock_selector.select.assert_called_once_with(slots, request)
-
-    mock_api_access.get_booking_token.assert_called_once_with(
-        expected_details_request_body
-    )
-
-    mock_api_access.book_slot.assert_called_once_with(expected_booking_request)
+    assert api_access.calls == [
+        ("find_booking_slots", expected_find_request_body),
+        ("select", (slots, request)),
+        ("get_booking_token", expected_details_request_body),
+        ("book_slot", expected_booking_request),
+    ]
 
 
-def test_make_reservation_days_in_advance():
-    config = ResyConfigFactory.create()
-    retries_config = ReservationRetriesConfigFactory.create()
+def test_make_reservation_days_in_advance(config, retries_config):
     request = ReservationRequestDaysInAdvanceFactory.create()
-    mock_api_access = MagicMock()
-    slots = SlotFactory.create_batch(3)
-    mock_api_access.find_booking_slots.return_value = slots
-
+    slot = SlotFactory.create()
+    slots = [slot]
     details_response = DetailsResponseBodyFactory.create()
-    mock_api_access.get_booking_token.return_value = details_response
-
-    mock_selector = MagicMock()
-    mock_selector.select.return_value = slots[0]
+    api_access = FakeApiAccess(
+        find_booking_slots_return=slots, get_booking_token_return=details_response
+    )
+    selector = FakeSelector(select_return=slot, calls=api_access.calls)
 
-    manager = ResyManager(config, mock_api_access, mock_selector, retries_config)
+    manager = ResyManager(config, api_access, selector, retries_config)
 
     manager.make_reservation(request)
 
-    expected_day = request.target_date.strftime("%Y-%m-%d")
+    expected_day = request.target_date.isoformat()
 
     expected_find_request_body = FindRequestBody(
         venue_id=request.venue_id, party_size=request.party_size, day=expected_day
     )
 
     expected_details_request_body = DetailsRequestBody(
-        config_id=slots[0].config.token, day=expected_day, party_size=request.party_size
+        config_id=slot.config.token, day=expected_day, party_size=request.party_size
     )
 
     expected_booking_request = BookRequestBody(
@@ -111,48 +102,34 @@ def test_make_reservation_days_in_advance():
         struct_payment_method=PaymentMethod(id=config.payment_method_id),
     )
 
-    mock_api_access.find_booking_slots.assert_called_once_with(
-        expected_find_request_body
-    )
-
-    mock_selector.select.assert_called_once_with(slots, request)
-
-    mock_api_access.get_booking_token.assert_called_once_with(
-        expected_details_request_body
-    )
-
-    mock_api_access.book_slot.assert_called_once_with(expected_booking_request)
+    assert api_access.calls == [
+        ("find_booking_slots", expected_find_request_body),
+        ("select", (slots, request)),
+        ("get_booking_token", expected_details_request_body),
+        ("book_slot", expected_booking_request),
+    ]
 
 
-def test_make_reservation_no_slots():
-    config = ResyConfigFactory.create()
-    retries_config = ReservationRetriesConfigFactory.create()
+def test_make_reservation_no_slots(retries_config, config):
     request = ReservationRequestFactory.create()
-    mock_api_access = MagicMock()
-    mock_api_access.find_booking_slots.return_value = []
-
-    mock_selector = MagicMock()
-
-    manager = ResyManager(config, mock_api_access, mock_selector, retries_config)
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retries_config)
 
     with pytest.raises(NoSlotsError):
         manager.make_reservation(request)
 
 
 @patch("resy_bot.manager.ResyManager.make_reservation")
-def test_make_reservation_with_retries(mock_make_reservation):
-    config = ResyConfigFactory.create()
+def test_make_reservation_with_retries(mock_make_reservation, config):
     mock_make_reservation.side_effect = NoSlotsError
-    mock_api_access = MagicMock()
-    mock_selector = MagicMock()
     retry_config = ReservationRetriesConfig(
         seconds_between_retries=0.01,
         n_retries=5,
+        base_delay=0,
     )
 
     request = ReservationRequestFactory.create()
 
-    manager = ResyManager(config, mock_api_access, mock_selector, retry_config)
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retry_config)
 
     with pytest.raises(ExhaustedRetriesError):
         manager.make_reservation_with_retries(request)
@@ -160,10 +137,7 @@ def test_make_reservation_with_retries(mock_make_reservation):
     assert mock_make_reservation.call_count == 5
 
 
-def test_get_drop_time():
-    config = ResyConfigFactory.create()
-    mock_api_access = MagicMock()
-    mock_selector = MagicMock()
+def test_get_drop_time(config):
     retry_config = ReservationRetriesConfig(
         seconds_between_retries=0.1,
         n_retries=5,
@@ -174,94 +148,153 @@ def test_get_drop_time():
         expected_drop_minute=0,
     )
 
-    manager = ResyManager(config, mock_api_access, mock_selector, retry_config)
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retry_config)
 
-    drop_time = manager._get_drop_time(request)
+    with freeze_time("2024-03-30 09:00:00"):
+        drop_time = manager._get_drop_time(request)
 
-    now = datetime.now()
-    expected = datetime(now.year, now.month, now.day, 10, 0) - timedelta(seconds=2)
+    expected = datetime(2024, 3, 30, 10, 0) - timedelta(seconds=2)
     assert drop_time == expected
 
+    with freeze_time("2024-03-30 09:00:00"):
+        drop_epoch_ns = manager._get_drop_epoch_ns(request)
+
+    assert drop_epoch_ns == int(expected.timestamp()) * 10**9
+
 
-@patch("resy_bot.manager.datetime")
 @patch("resy_bot.manager.ResyManager.make_reservation_with_retries")
-def test_make_reservation_at_opening_time(mock_make_reservation, mock_dt):
-    now = datetime.now()
-    mock_dt.now.return_value = now - timedelta(seconds=0.1)
+def test_make_reservation_at_opening_time(mock_make_reservation, config):
     request = TimedReservationRequestFactory.create(
-        expected_drop_hour=now.hour,
-        expected_drop_minute=now.minute,
-    )
-    # _get_drop_time uses datetime(year, month, day, hour, minute) - timedelta(seconds=2)
-    mock_dt.return_value = datetime(
-        year=now.year,
-        month=now.month,
-        day=now.day,
-        hour=now.hour,
-        minute=now.minute,
+        expected_drop_hour=10,
+        expected_drop_minute=0,
     )
-    mock_dt.side_effect = None
+    drop_time = datetime(2024, 3, 30, 10, 0) - timedelta(seconds=2)
 
-    config = ResyConfigFactory.create()
-    mock_api_access = MagicMock()
-    mock_selector = MagicMock()
     retry_config = ReservationRetriesConfig(
         seconds_between_retries=0.1,
         n_retries=5,
     )
 
-    manager = ResyManager(config, mock_api_access, mock_selector, retry_config)
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retry_config)
 
-    manager.make_reservation_at_opening_time(request)
+    # every clock read advances 10ms, so the final spin ends without wall time;
+    # sleeps are no-ops via the autouse fixture in conftest
+    with freeze_time(drop_time - timedelta(seconds=0.1), auto_tick_seconds=0.01):
+        manager.make_reservation_at_opening_time(request)
 
     mock_make_reservation.assert_called_once()
 
 
-@patch("resy_bot.manager.ResyManager.make_reservation")
-def test_retry_on_500_does_not_count(mock_make_reservation):
+@patch("resy_bot.manager.ResyManager.make_reservation_with_retries")
+@patch("resy_bot.manager.ResyManager._get_drop_time")
+def test_make_reservation_at_opening_time_warms_up_ahead_of_drop(
+    mock_get_drop_time, mock_make_reservation, retries_config, config
+):
+    drop_time = datetime(2024, 3, 30, 10, 0)
+    mock_get_drop_time.return_value = drop_time
+    request = TimedReservationRequestFactory.create()
+    api_access = FakeApiAccess()
+
+    manager = ResyManager(config, api_access, FakeSelector(), retries_config)
+
+    with freeze_time(drop_time - timedelta(seconds=4), auto_tick_seconds=0.01):
+        manager.make_reservation_at_opening_time(request)
+
+    assert api_access.calls == [("warm_up", None)]
+
+
+@patch("resy_bot.manager.ResyManager.make_reservation_with_retries")
+@patch("resy_bot.manager.ResyManager._get_drop_time")
+def test_make_reservation_at_opening_time_skips_late_warm_up(
+    mock_get_drop_time, mock_make_reservation, retries_config, config
+):
+    drop_time = datetime(2024, 3, 30, 10, 0)
+    mock_get_drop_time.return_value = drop_time
+    request = TimedReservationRequestFactory.create()
+    api_access = FakeApiAccess()
+
+    manager = ResyManager(config, api_access, FakeSelector(), retries_config)
+
+    # less than the warm up timeout before the drop
+    with freeze_time(drop_time - timedelta(seconds=1), auto_tick_seconds=0.01):
+        manager.make_reservation_at_opening_time(request)
+
+    assert api_access.calls == []
+    mock_make_reservation.assert_called_once()
+
+
+def test_retry_on_500_does_not_count(config):
     """500 errors should not count toward the retry limit."""
-    config = ResyConfigFactory.create()
-    # First two calls: server error, third call: no slots, fourth: success
-    mock_make_reservation.side_effect = [
-        ResyServerError("500"),
-        ResyServerError("500"),
-        NoSlotsError("no slots"),
-        "token123",
-    ]
-    mock_api_access = MagicMock()
-    mock_selector = MagicMock()
+    make_reservation = StepMock(
+        [
+            ("500", ResyServerError),
+            ("500", ResyServerError),
+            ("no slots", NoSlotsError),
+            ("success", "token123"),
+        ]
+    )
     retry_config = ReservationRetriesConfig(
         seconds_between_retries=0.01,
         n_retries=2,
+        base_delay=0,
+        server_error_base_delay=0,
     )
 
     request = ReservationRequestFactory.create()
-    manager = ResyManager(config, mock_api_access, mock_selector, retry_config)
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retry_config)
+
+    with patch.object(ResyManager, "make_reservation", make_reservation):
+        result = manager.make_reservation_with_retries(request)
 
-    result = manager.make_reservation_with_retries(request)
     assert result == "token123"
-    # 2 server errors + 1 no slots + 1 success = 4 calls
-    assert mock_make_reservation.call_count == 4
+    assert make_reservation.labels == ["500", "500", "no slots", "success"]
+
+
+@patch("resy_bot.manager.sleep")
+def test_server_error_backoff_resets_after_completed_pass(mock_sleep, config):
+    make_reservation = StepMock(
+        [
+            ("500", ResyServerError),
+            ("500", ResyServerError),
+            ("no slots", NoSlotsError),
+            ("500", ResyServerError),
+            ("success", "token123"),
+        ]
+    )
+    retry_config = ReservationRetriesConfig(
+        seconds_between_retries=0.1,
+        n_retries=5,
+        server_error_base_delay=1.0,
+        max_delay=10.0,
+        jitter=0,
+    )
+
+    request = ReservationRequestFactory.create()
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retry_config)
+
+    with patch.object(ResyManager, "make_reservation", make_reservation):
+        assert manager.make_reservation_with_retries(request) == "token123"
+
+    sleeps = [c[0][0] for c in mock_sleep.call_args_list]
+    assert sleeps == pytest.approx([1.0, 2.0, 0.1, 1.0])
 
 
 @patch("resy_bot.manager.ResyManager.make_reservation")
-def test_fallback_party_sizes(mock_make_reservation):
+def test_fallback_party_sizes(mock_make_reservation, config):
     """If primary party size has no slots, try fallback sizes."""
-    config = ResyConfigFactory.create()
     # First call (party=4): no slots, second call (party=2): success
     mock_make_reservation.side_effect = [NoSlotsError("no slots"), "token456"]
-    mock_api_access = MagicMock()
-    mock_selector = MagicMock()
     retry_config = ReservationRetriesConfig(
         seconds_between_retries=0.01,
         n_retries=5,
+        base_delay=0,
     )
 
     request = ReservationRequestFactory.create(
         party_size=4,
         fallback_party_sizes=[2],
     )
-    manager = ResyManager(config, mock_api_access, mock_selector, retry_config)
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retry_config)
 
     result = manager.make_reservation_with_retries(request)
     assert result == "token456"
@@ -269,19 +302,19 @@ def test_fallback_party_sizes(mock_make_reservation):
     # Verify the second call used party_size=2
     second_call_request = mock_make_reservation.call_args_list[1][0][0]
     assert second_call_request.party_size == 2
+    second_call_find_body = mock_make_reservation.call_args_list[1][1]["find_body"]
+    assert second_call_find_body.party_size == 2
 
 
 @patch("resy_bot.manager.ResyManager.make_reservation")
-def test_date_range(mock_make_reservation):
+def test_date_range(mock_make_reservation, config):
     """date_range should try multiple dates."""
-    config = ResyConfigFactory.create()
     # First call (target date): no slots, second call (target+1): success
     mock_make_reservation.side_effect = [NoSlotsError("no slots"), "token789"]
-    mock_api_access = MagicMock()
-    mock_selector = MagicMock()
     retry_config = ReservationRetriesConfig(
         seconds_between_retries=0.01,
         n_retries=5,
+        base_delay=0,
     )
 
     from datetime import date
@@ -290,7 +323,7 @@ def test_date_range(mock_make_reservation):
         ideal_date=target,
         date_range=3,
     )
-    manager = ResyManager(config, mock_api_access, mock_selector, retry_config)
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retry_config)
 
     result = manager.make_reservation_with_retries(request)
     assert result == "token789"
@@ -299,3 +332,339 @@ def test_date_range(mock_make_reservation):
     second_req = mock_make_reservation.call_args_list[1][0][0]
     assert first_req.ideal_date == target
     assert second_req.ideal_date == target + timedelta(days=1)
+    second_find_body = mock_make_reservation.call_args_list[1][1]["find_body"]
+    assert second_find_body.day == (target + timedelta(days=1)).isoformat()
+
+
+@patch("resy_bot.manager.sleep")
+@patch("resy_bot.manager.time")
+def test_wait_until_sleeps_then_spins_briefly(
+    mock_time, mock_sleep, retries_config, config
+):
+    drop_epoch_ns = 2_000_000_000 * 10**9
+    mock_time.time_ns.return_value = drop_epoch_ns - 30 * 10**9
+    mock_time.monotonic_ns.side_effect = [
+        0,
+        0,
+        10 * 10**9,
+        20 * 10**9,
+        int(29.95 * 10**9),
+        int(29.99 * 10**9),
+        30 * 10**9,
+    ]
+
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retries_config)
+
+    manager._wait_until(drop_epoch_ns)
+
+    sleeps = [c[0][0] for c in mock_sleep.call_args_list]
+    assert sleeps == pytest.approx([10, 10, 9.95])
+
+
+@patch("resy_bot.manager.ResyManager.make_reservation_with_retries")
+def test_make_reservation_at_opening_time_with_drop_event(
+    mock_make_reservation, retries_config, config
+):
+    now = datetime.now() + timedelta(hours=1)
+    request = TimedReservationRequestFactory.create(
+        expected_drop_hour=now.hour,
+        expected_drop_minute=now.minute,
+    )
+
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retries_config)
+
+    drop_event = threading.Event()
+    drop_event.set()
+
+    manager.make_reservation_at_opening_time(request, drop_event=drop_event)
+
+    mock_make_reservation.assert_called_once()
+
+
+def test_find_cache():
+    request = ReservationRequestFactory.create()
+    slot = SlotFactory.create()
+    slots = [slot]
+    api_access = FakeApiAccess(find_booking_slots_return=slots)
+
+    find_cache = FindCache(api_access.find_booking_slots)
+
+    body = FindRequestBody(
+        venue_id=request.venue_id,
+        party_size=request.party_size,
+        day=request.ideal_date.isoformat(),
+    )
+
+    assert find_cache.get(body) == slots
+    assert find_cache.get(body) == slots
+    assert api_access.find_calls == [body]
+
+    find_cache.clear()
+    assert find_cache.get(body) == slots
+    assert api_access.find_calls == [body, body]
+
+
+@pytest.mark.real_sleep
+@patch("resy_bot.manager.ResyManager.make_reservation_with_retries")
+@patch("resy_bot.manager.ResyManager._get_drop_time")
+def test_make_reservation_at_opening_time_speculative_find(
+    mock_get_drop_time, mock_make_reservation, retries_config, config
+):
+    mock_get_drop_time.return_value = datetime.now() + timedelta(seconds=0.3)
+    request = TimedReservationRequestFactory.create(speculative_lead_ms=200)
+
+    slot = SlotFactory.create()
+    slots = [slot]
+    api_access = FakeApiAccess(
+        find_booking_slots_return=slots,
+        get_booking_token_return=DetailsResponseBodyFactory.create(),
+        book_slot_return="token123",
+    )
+    selector = FakeSelector(select_return=slot)
+
+    manager = ResyManager(config, api_access, selector, retries_config)
+
+    assert manager.make_reservation_at_opening_time(request) == "token123"
+    assert len(api_access.find_calls) == 1
+    mock_make_reservation.assert_not_called()
+
+
+@pytest.mark.real_sleep
+@patch("resy_bot.manager.ResyManager.make_reservation_with_retries")
+@patch("resy_bot.manager.ResyManager._get_drop_time")
+def test_make_reservation_at_opening_time_speculative_find_empty(
+    mock_get_drop_time, mock_make_reservation, retries_config, config
+):
+    mock_get_drop_time.return_value = datetime.now() + timedelta(seconds=0.3)
+    request = TimedReservationRequestFactory.create(speculative_lead_ms=200)
+
+    api_access = FakeApiAccess()
+
+    manager = ResyManager(config, api_access, FakeSelector(), retries_config)
+
+    manager.make_reservation_at_opening_time(request)
+
+    assert api_access.book_slot_calls == []
+    mock_make_reservation.assert_called_once_with(request.reservation_request)
+
+
+@pytest.mark.parametrize("lead_ms", [0, -200])
+def test_speculative_lead_ms_must_be_positive(lead_ms):
+    with pytest.raises(ValidationError):
+        TimedReservationRequestFactory.create(speculative_lead_ms=lead_ms)
+
+    entry = TimedReservationRequestFactory.create().dict()
+    entry["speculative_lead_ms"] = lead_ms
+    with pytest.raises(ValidationError):
+        WatchlistEntry(**entry)
+
+
+def test_compute_backoff():
+    schedule = ReservationRetriesConfig(
+        seconds_between_retries=0.1, n_retries=10, max_delay=5.0
+    ).backoff_schedule
+    assert schedule == pytest.approx((0.1, 0.2, 0.4, 0.8, 1.6, 3.2))
+
+    for attempt in range(10):
+        delay = compute_backoff(schedule, attempt, max_delay=5.0, jitter=0.5)
+        expected = min(5.0, 0.1 * 2 ** min(attempt, 5))
+        assert expected <= delay <= min(5.0, 1.5 * expected)
+
+
+def test_backoff_schedule_follows_config_fields():
+    retry_config = ReservationRetriesConfig(
+        seconds_between_retries=0.3, n_retries=5, max_delay=5.0
+    )
+    assert retry_config.backoff_schedule == pytest.approx(
+        (0.3, 0.6, 1.2, 2.4, 4.8, 5.0)
+    )
+
+    updated = retry_config.copy(update={"base_delay": 0.0})
+    assert updated.backoff_schedule == (0.0,) * 6
+
+    constructed = ReservationRetriesConfig.construct(
+        base_delay=0.1, max_delay=5.0, server_error_base_delay=1.0
+    )
+    assert constructed.backoff_schedule[0] == 0.1
+    assert constructed.server_error_backoff_schedule[0] == 1.0
+
+
+@patch("resy_bot.manager.sleep")
+@patch("resy_bot.manager.ResyManager.make_reservation")
+def test_retry_sleeps_increase(mock_make_reservation, mock_sleep, config):
+    mock_make_reservation.side_effect = NoSlotsError
+    retry_config = ReservationRetriesConfig(
+        seconds_between_retries=0.1,
+        n_retries=4,
+        max_delay=10.0,
+        jitter=0,
+    )
+
+    request = ReservationRequestFactory.create()
+    manager = ResyManager(config, FakeApiAccess(), FakeSelector(), retry_config)
+
+    with pytest.raises(ExhaustedRetriesError):
+        manager.make_reservation_with_retries(request)
+
+    sleeps = [c[0][0] for c in mock_sleep.call_args_list]
+    assert sleeps == pytest.approx([0.1, 0.2, 0.4, 0.8])
+
+
+def test_duplicate_variants_share_find_request(config):
+    api_access = FakeApiAccess()
+    retry_config = ReservationRetriesConfig(
+        seconds_between_retries=0.01,
+        n_retries=1,
+        base_delay=0,
+    )
+
+    request = ReservationRequestFactory.create(
+        party_size=2,
+        fallback_party_sizes=[2],
+    )
+    manager = ResyManager(config, api_access, FakeSelector(), retry_config)
+
+    with pytest.raises(ExhaustedRetriesError):
+        manager.make_reservation_with_retries(request)
+
+    assert len(api_access.find_calls) == 1
+
+
+def test_each_retry_pass_sends_fresh_find_requests(config):
+    api_access = FakeApiAccess()
+    # no wait between passes, well inside the find cache ttl
+    retry_config = ReservationRetriesConfig(
+        seconds_between_retries=0.01,
+        n_retries=3,
+        base_delay=0,
+    )
+
+    request = ReservationRequestFactory.create()
+    manager = ResyManager(config, api_access, FakeSelector(), retry_config)
+
+    with pytest.raises(ExhaustedRetriesError):
+        manager.make_reservation_with_retries(request)
+
+    assert len(api_access.find_calls) == 3
+
+
+def test_variants_are_probed_concurrently_once_per_pass(config):
+    api_access = FakeApiAccess()
+    # every find blocks until all three are in flight, so a serial pass
+    # would break the barrier instead of getting through it
+    barrier = threading.Barrier(3, timeout=1)
+
+    def find_booking_slots(params):
+        barrier.wait()
+        return FakeApiAccess.find_booking_slots(api_access, params)
+
+    api_access.find_booking_slots = find_booking_slots
+    retry_config = ReservationRetriesConfig(
+        seconds_between_retries=0.01,
+        n_retries=1,
+        base_delay=0,
+    )
+
+    request = ReservationRequestFactory.create(
+        party_size=4,
+        fallback_party_sizes=[2, 3],
+    )
+    manager = ResyManager(config, api_access, FakeSelector(), retry_config)
+
+    with pytest.raises(ExhaustedRetriesError):
+        manager.make_reservation_with_retries(request)
+
+    party_sizes = sorted(body.party_size for body in api_access.find_calls)
+    assert party_sizes == [2, 3, 4]
+
+
+def test_primary_variant_does_not_wait_for_fallback_finds(config):
+    slot = SlotFactory.create()
+    api_access = FakeApiAccess(
+        get_booking_token_return=DetailsResponseBodyFactory.create(),
+        book_slot_return="token123",
+    )
+    release_fallbacks = threading.Event()
+
+    def find_booking_slots(params):
+        if params.party_size == 4:
+            return [slot]
+        release_fallbacks.wait(timeout=5)
+        return []
+
+    api_access.find_booking_slots = find_booking_slots
+    retry_config = ReservationRetriesConfig(
+        seconds_between_retries=0.01,
+        n_retries=1,
+        base_delay=0,
+    )
+
+    request = ReservationRequestFactory.create(
+        party_size=4,
+        fallback_party_sizes=[2, 3],
+    )
+    manager = ResyManager(
+        config, api_access, FakeSelector(select_return=slot), retry_config
+    )
+
+    started = time.monotonic()
+    try:
+        assert manager.make_reservation_with_retries(request) == "token123"
+        assert time.monotonic() - started < 1
+    finally:
+        release_fallbacks.set()
+
+
+def test_concurrent_runs_for_one_venue_keep_their_own_finds(config):
+    slot = SlotFactory.create()
+    api_access = FakeApiAccess(
+        get_booking_token_return=DetailsResponseBodyFactory.create(),
+        book_slot_return="token123",
+    )
+    first_primary_find = threading.Event()
+    # both runs' fallback finds have to be in flight together, so a run that
+    # waited on (or cleared) the other run's find would break the barrier
+    barrier = threading.Barrier(2, timeout=1)
+
+    def find_booking_slots(params):
+        FakeApiAccess.find_booking_slots(api_access, params)
+        if params.party_size == 4:
+            first_primary_find.set()
+            return []
+        barrier.wait()
+        return [slot]
+
+    api_access.find_booking_slots = find_booking_slots
+    retry_config = ReservationRetriesConfig(
+        seconds_between_retries=0.01,
+        n_retries=1,
+        base_delay=0,
+    )
+
+    request = ReservationRequestFactory.create(
+        party_size=4,
+        fallback_party_sizes=[2],
+    )
+    manager = ResyManager(
+        config, api_access, FakeSelector(select_return=slot), retry_config
+    )
+
+    results = {}
+
+    def run(name):
+        try:
+            results[name] = manager.make_reservation_with_retries(request)
+        except Exception as e:
+            results[name] = repr(e)
+
+    first = threading.Thread(target=run, args=("first",))
+    second = threading.Thread(target=run, args=("second",))
+    first.start()
+    assert first_primary_find.wait(timeout=1)
+    second.start()
+    first.join()
+    second.join()
+
+    assert results == {"first": "token123", "second": "token123"}
+    party_sizes = sorted(body.party_size for body in api_access.find_calls)
+    assert party_sizes == [2, 2, 4, 4]
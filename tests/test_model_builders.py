@@ -3,12 +3,12 @@ from datetime import date
 from tests.factories import (
     ReservationRequestFactory,
     SlotFactory,
-    ResyConfigFactory,
     DetailsResponseBodyFactory,
 )
 from resy_bot.models import (
     FindRequestBody,
     DetailsRequestBody,
+    PaymentMethod,
 )
 from resy_bot.model_builders import (
     build_find_request_body,
@@ -43,20 +43,26 @@ def test_build_get_slot_details_body():
     assert body.party_size == request.party_size
 
 
-def test_build_auth_request_body():
-    config = ResyConfigFactory.create()
-
+def test_build_auth_request_body(config):
     body = build_auth_request_body(config)
 
     assert body.email == config.email
     assert body.password == config.password
 
 
-def test_build_book_request_body():
+def test_build_book_request_body(config):
     details = DetailsResponseBodyFactory.create()
-    config = ResyConfigFactory.create()
 
     body = build_book_request_body(details, config)
 
     assert body.book_token == details.book_token.value
     assert body.struct_payment_method.id == config.payment_method_id
+
+
+def test_build_book_request_body_reuses_payment_method(config):
+    details = DetailsResponseBodyFactory.create()
+    payment_method = PaymentMethod(id=config.payment_method_id)
+
+    body = build_book_request_body(details, config, payment_method)
+
+    assert body.struct_payment_method is payment_method
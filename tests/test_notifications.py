@@ -0,0 +1,168 @@
+import smtplib
+import pytest
+from pydantic import ValidationError
+from unittest.mock import patch
+
+from resy_bot.models import ResyConfig
+from resy_bot.notifications import RateLimiter, SMTPClient, send_email
+
+from tests.fakes import FakeSMTP
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake_clock = FakeClock()
+    with patch("resy_bot.notifications.time", fake_clock):
+        yield fake_clock
+
+
+def test_rate_limiter_allows_burst_then_refuses(clock):
+    limiter = RateLimiter(rate_per_second=1.0, burst=3)
+
+    assert [limiter.acquire(timeout=0) for _ in range(3)] == [True, True, True]
+    assert limiter.acquire(timeout=0) is False
+
+
+def test_rate_limiter_refills_over_time(clock):
+    limiter = RateLimiter(rate_per_second=2.0, burst=1)
+    assert limiter.acquire(timeout=0)
+
+    clock.now += 0.5
+
+    assert limiter.acquire(timeout=0)
+
+
+def test_rate_limiter_refill_is_capped_at_burst(clock):
+    limiter = RateLimiter(rate_per_second=1.0, burst=2)
+    clock.now += 60
+
+    assert [limiter.acquire(timeout=0) for _ in range(3)] == [True, True, False]
+
+
+def test_rate_limiter_waits_for_next_token(clock):
+    limiter = RateLimiter(rate_per_second=4.0, burst=1)
+    assert limiter.acquire(timeout=0)
+
+    assert limiter.acquire(timeout=1)
+    assert clock.sleeps == pytest.approx([0.25])
+
+
+def test_send_email_times_out_on_rate_limit(clock, monkeypatch):
+    limiter = RateLimiter(rate_per_second=0.01, burst=1)
+    assert limiter.acquire(timeout=0)
+    monkeypatch.setattr("resy_bot.notifications._limiter", limiter)
+
+    with pytest.raises(TimeoutError):
+        send_email(
+            subject="subject",
+            body="body",
+            to_email="me@example.com",
+            from_email="bot@example.com",
+            app_password="app-password",
+        )
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1.0, 1), (1.0, 0)])
+def test_rate_limiter_rejects_invalid_limits(rate, burst):
+    with pytest.raises(ValueError):
+        RateLimiter(rate_per_second=rate, burst=burst)
+
+
+@pytest.mark.parametrize(
+    "update",
+    [{"notification_rate_per_second": 0}, {"notification_burst": 0}],
+)
+def test_resy_config_rejects_invalid_rate_limits(config, update):
+    with pytest.raises(ValidationError):
+        ResyConfig(**{**config.dict(), **update})
+
+
+@patch("resy_bot.notifications.smtplib.SMTP")
+def test_smtp_client_connects_lazily_and_reuses_connection(mock_smtp):
+    servers = []
+
+    def connect(host, port):
+        servers.append(FakeSMTP(host, port))
+        return servers[-1]
+
+    mock_smtp.side_effect = connect
+
+    client = SMTPClient("bot@example.com", "app-password")
+    assert servers == []
+
+    client.sendmail("me@example.com", "first")
+    client.sendmail("me@example.com", "second")
+
+    assert len(servers) == 1
+    assert servers[0].logins == [("bot@example.com", "app-password")]
+    assert [msg for _, _, msg in servers[0].sent] == ["first", "second"]
+
+    client.close()
+    assert servers[0].quit_called
+
+
+@patch("resy_bot.notifications.smtplib.SMTP")
+def test_smtp_client_reconnects_after_disconnect(mock_smtp):
+    dropped = FakeSMTP(
+        "smtp.gmail.com", 587, smtplib.SMTPServerDisconnected("connection closed")
+    )
+    fresh = FakeSMTP("smtp.gmail.com", 587)
+    mock_smtp.side_effect = [dropped, fresh]
+
+    client = SMTPClient("bot@example.com", "app-password")
+    client.sendmail("me@example.com", "hello")
+
+    assert dropped.closed
+    assert fresh.sent == [("bot@example.com", "me@example.com", "hello")]
+
+
+@patch("resy_bot.notifications.smtplib.SMTP")
+def test_smtp_client_does_not_resend_refused_message(mock_smtp):
+    refused = smtplib.SMTPRecipientsRefused({"me@example.com": (550, b"no")})
+    mock_smtp.side_effect = [FakeSMTP("smtp.gmail.com", 587, refused)]
+
+    client = SMTPClient("bot@example.com", "app-password")
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        client.sendmail("me@example.com", "hello")
+
+    assert mock_smtp.call_count == 1
+
+
+@patch("resy_bot.notifications.smtplib.SMTP")
+def test_smtp_client_closes_connection_when_login_fails(mock_smtp):
+    servers = []
+
+    def connect(host, port):
+        rejected = smtplib.SMTPAuthenticationError(535, b"bad credentials")
+        servers.append(FakeSMTP(host, port, login_error=rejected))
+        return servers[-1]
+
+    mock_smtp.side_effect = connect
+
+    client = SMTPClient("bot@example.com", "wrong-password")
+    for _ in range(2):
+        with pytest.raises(smtplib.SMTPAuthenticationError):
+            client.sendmail("me@example.com", "hello")
+
+    assert len(servers) == 2
+    assert all(server.closed for server in servers)
+
+
+def test_smtp_client_requires_app_password():
+    client = SMTPClient("bot@example.com", None)
+
+    with pytest.raises(ValueError):
+        client.sendmail("me@example.com", "hello")
@@ -0,0 +1,46 @@
+import pytest
+from requests import HTTPError
+
+from resy_bot.errors import NoSlotsError, ResyServerError
+from resy_bot.retries import RetryOutcome, RetryState, TRANSITIONS, classify
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (NoSlotsError("none"), RetryOutcome.NEXT_VARIANT),
+        (ResyServerError("500"), RetryOutcome.RETRY_NO_INCREMENT),
+        (HTTPError("400"), RetryOutcome.FAIL),
+        (ValueError("bad"), RetryOutcome.FAIL),
+    ],
+)
+def test_classify(exc, expected):
+    assert classify(exc) is expected
+
+
+def test_next_variant_advances_within_pass():
+    state = RetryState(n_variants=3, variant_index=1, retries=2)
+
+    assert TRANSITIONS[RetryOutcome.NEXT_VARIANT](state) == RetryState(
+        n_variants=3, variant_index=2, retries=2
+    )
+
+
+def test_next_variant_wraps_and_counts_retry_at_end_of_pass():
+    state = RetryState(n_variants=3, variant_index=2, retries=2, server_errors=2)
+
+    assert TRANSITIONS[RetryOutcome.NEXT_VARIANT](state) == RetryState(
+        n_variants=3, variant_index=0, retries=3
+    )
+
+
+def test_retry_no_increment_restarts_pass_without_counting():
+    state = RetryState(n_variants=3, variant_index=1, retries=2, server_errors=1)
+
+    assert TRANSITIONS[RetryOutcome.RETRY_NO_INCREMENT](state) == RetryState(
+        n_variants=3, variant_index=0, retries=2, server_errors=2
+    )
+
+
+def test_fail_has_no_transition():
+    assert RetryOutcome.FAIL not in TRANSITIONS